@@ -7,6 +7,19 @@ import re
 from datetime import datetime
 from typing import Tuple
 
+import numpy as np
+import pandas as pd
+
+# Tier boundaries as (upper z-score bound, tier), fastest tier first.
+# Anything at or above the last bound is 'D'.
+TIER_THRESHOLDS = (
+    (-1.5, 'S+'),
+    (-1.0, 'S'),
+    (-0.5, 'A'),
+    (0.0, 'B'),
+    (0.5, 'C'),
+)
+
 
 def parse_time_to_seconds(time_str: str) -> float:
     """
@@ -39,6 +52,31 @@ def parse_time_to_seconds(time_str: str) -> float:
         return 0.0
 
 
+def parse_times_to_seconds(time_strs: pd.Series) -> pd.Series:
+    """
+    Convert a column of lap time strings to seconds in one vectorized pass.
+    Array counterpart of parse_time_to_seconds(); values that are not in
+    "MM:SS.ms" format fall back to the scalar parser.
+
+    Args:
+        time_strs: Series of times in format "MM:SS.ms"
+
+    Returns:
+        Series of times in seconds as float
+
+    Examples:
+        >>> parse_times_to_seconds(pd.Series(["01:01.518", "00:25.026"])).tolist()
+        [61.518, 25.026]
+    """
+    parts = time_strs.str.extract(r'^(\d+):(\d+(?:\.\d+)?)$')
+    seconds = parts[0].astype(float) * 60 + parts[1].astype(float)
+
+    unmatched = seconds.isna()
+    if unmatched.any():
+        seconds[unmatched] = time_strs[unmatched].map(parse_time_to_seconds)
+    return seconds
+
+
 def format_seconds_to_time(seconds: float) -> str:
     """
     Convert seconds to lap time string format.
@@ -108,18 +146,53 @@ def assign_tier(z_score: float) -> str:
         >>> assign_tier(0.6)
         'D'
     """
-    if z_score < -1.5:
-        return 'S+'
-    elif z_score < -1.0:
-        return 'S'
-    elif z_score < -0.5:
-        return 'A'
-    elif z_score < 0.0:
-        return 'B'
-    elif z_score < 0.5:
-        return 'C'
-    else:
-        return 'D'
+    for bound, tier in TIER_THRESHOLDS:
+        if z_score < bound:
+            return tier
+    return 'D'
+
+
+def calculate_z_scores(times: np.ndarray, mean: float, std_dev: float) -> np.ndarray:
+    """
+    Calculate z-scores for an array of times in one vectorized pass.
+    Array counterpart of calculate_z_score().
+
+    Args:
+        times: Lap times in seconds
+        mean: Mean lap time in seconds
+        std_dev: Standard deviation of lap times
+
+    Returns:
+        Array of z-scores (negative means faster than average)
+
+    Examples:
+        >>> calculate_z_scores(np.array([60.0, 65.0]), 65.0, 2.0).tolist()
+        [-2.5, 0.0]
+    """
+    times = np.asarray(times, dtype=float)
+    if std_dev == 0:
+        return np.zeros_like(times)
+    return (times - mean) / std_dev
+
+
+def assign_tiers(z_scores: np.ndarray) -> np.ndarray:
+    """
+    Assign skill tiers for an array of z-scores in one vectorized pass.
+    Array counterpart of assign_tier(), using the same thresholds.
+
+    Args:
+        z_scores: Z-score values (negative is better)
+
+    Returns:
+        Array of tier strings ("S+", "S", "A", "B", "C", or "D")
+
+    Examples:
+        >>> assign_tiers(np.array([-1.6, -0.7, 0.6])).tolist()
+        ['S+', 'A', 'D']
+    """
+    z_scores = np.asarray(z_scores, dtype=float)
+    conditions = [z_scores < bound for bound, _ in TIER_THRESHOLDS]
+    return np.select(conditions, [tier for _, tier in TIER_THRESHOLDS], default='D')
 
 
 def calculate_percentile(position: int, total: int) -> float:
@@ -142,6 +215,25 @@ def calculate_percentile(position: int, total: int) -> float:
     return (position / total) * 100
 
 
+def calculate_percentiles(positions: np.ndarray, total: int) -> np.ndarray:
+    """
+    Calculate percentile ranks for an array of positions in one vectorized pass.
+    Array counterpart of calculate_percentile().
+
+    Args:
+        positions: Driver positions (1-indexed)
+        total: Total number of drivers
+
+    Returns:
+        Array of percentiles (e.g., 1.5 for top 1.5%)
+
+    Examples:
+        >>> calculate_percentiles(np.array([1, 50]), 100).tolist()
+        [1.0, 50.0]
+    """
+    return (np.asarray(positions, dtype=float) / total) * 100
+
+
 def parse_date(date_str: str) -> datetime:
     """
     Parse date string from CSV to datetime object.
@@ -171,6 +263,33 @@ def parse_date(date_str: str) -> datetime:
             return None
 
 
+def parse_dates(date_strs: pd.Series) -> pd.Series:
+    """
+    Parse a column of date strings in one vectorized pass.
+    Array counterpart of parse_date(), accepting the same two formats.
+
+    Args:
+        date_strs: Series of dates in format "DD.MM.YYYY" or "YYYY-MM-DD"
+
+    Returns:
+        Series of datetimes (NaT where the date is missing or invalid)
+
+    Examples:
+        >>> parse_dates(pd.Series(["27.12.2025", "2024-06-15"])).dt.strftime("%Y-%m-%d").tolist()
+        ['2025-12-27', '2024-06-15']
+    """
+    dates = pd.to_datetime(date_strs, format="%d.%m.%Y", errors='coerce')
+
+    unparsed = dates.isna()
+    if unparsed.any():
+        dates[unparsed] = pd.to_datetime(date_strs[unparsed], format="%Y-%m-%d", errors='coerce')
+
+    for date_str in date_strs[dates.isna()]:
+        if isinstance(date_str, str) and date_str.strip() != '':
+            print(f"Warning: Could not parse date '{date_str}', using None")
+    return dates
+
+
 def create_slug(name: str) -> str:
     """
     Create URL-safe slug from name.
@@ -4,24 +4,33 @@ Reads CSV files from RaceFacer scraper and syncs to MongoDB Atlas.
 Calculates tiers, percentiles, gaps, and track statistics.
 """
 
+import hashlib
+import io
 import os
 import sys
+import threading
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
 from pathlib import Path
 import pandas as pd
 import numpy as np
-from pymongo import MongoClient, ASCENDING, DESCENDING, UpdateOne
+from pymongo import MongoClient, ASCENDING, DESCENDING, DeleteMany, IndexModel, ReturnDocument, UpdateOne
+from pymongo.write_concern import WriteConcern
+from bson import encode
+from bson.raw_bson import RawBSONDocument
 from datetime import datetime
 from dotenv import load_dotenv
 
 # Add parent directory to path to import calculations
 sys.path.append(str(Path(__file__).parent))
 from calculations import (
-    parse_time_to_seconds,
+    parse_times_to_seconds,
     format_seconds_to_time,
-    calculate_z_score,
-    assign_tier,
-    calculate_percentile,
-    parse_date,
+    calculate_z_scores,
+    assign_tiers,
+    calculate_percentiles,
+    parse_dates,
     create_slug
 )
 
@@ -55,6 +64,9 @@ worldrecordhistory_col = db['worldrecordhistory']
 
 print("Connected successfully!")
 
+# Repository root; CSV paths in TRACKS_DATA are relative to it
+BASE_DIR = Path(__file__).resolve().parent.parent
+
 # Track data configuration
 TRACKS_DATA = [
     {
@@ -106,6 +118,36 @@ TRACKS_DATA = [
     }
 ]
 
+# Columns read from the scraper CSVs, with explicit dtypes to skip type inference.
+# Max km/h and Max G use '-' as a placeholder in some files.
+CSV_COLUMNS = ['Position', 'Name', 'Date', 'Max km/h', 'Max G', 'Best Time', 'Profile URL', 'Kart Type']
+CSV_DTYPES = {
+    'Position': 'int32',
+    'Max km/h': 'float64',
+    'Max G': 'float64',
+    'Kart Type': 'category'
+}
+CSV_NA_VALUES = {'Max km/h': ['-'], 'Max G': ['-']}
+
+# Bulk writes are sent in batches of this size, several batches at a time
+BULK_BATCH_SIZE = 1000
+BULK_WRITE_WORKERS = 4
+
+# The sync is idempotent and simply re-run on failure, so bulk writes only wait
+# for the primary to acknowledge them
+BULK_WRITE_CONCERN = WriteConcern(w=1)
+
+
+def read_track_csv(csv_path):
+    """Read a scraper CSV, loading only the known columns with explicit dtypes."""
+    return pd.read_csv(
+        os.fspath(csv_path),
+        usecols=lambda col: col in CSV_COLUMNS,  # Kart Type is absent from older files
+        dtype=CSV_DTYPES,
+        na_values=CSV_NA_VALUES,
+        engine='c'
+    )
+
 
 def clean_data(df):
     """Clean and prepare DataFrame."""
@@ -121,8 +163,204 @@ def clean_data(df):
     return df
 
 
-def calculate_hall_of_fame(df, track_id, track_slug):
-    """Calculate World Record history (Hall of Fame) for a track."""
+def safe_int(value):
+    """Safely convert a CSV value to int, returning None for blanks and placeholders."""
+    if pd.isna(value):
+        return None
+    try:
+        return int(float(value))
+    except (ValueError, TypeError):
+        return None
+
+
+def safe_float(value):
+    """Safely convert a CSV value to float, returning None for blanks and placeholders."""
+    if pd.isna(value):
+        return None
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def bulk_write_batched(collection, ops):
+    """
+    Execute unordered bulk write ops in fixed-size batches on a thread pool.
+    Ops may be any iterable (e.g. a generator); batches are pulled lazily and at
+    most BULK_WRITE_WORKERS are in flight, so memory stays flat while the next
+    batch is built. PyMongo releases the GIL during network I/O.
+
+    Returns:
+        Tuple of (upserted_count, modified_count) summed across batches
+    """
+    collection = collection.with_options(write_concern=BULK_WRITE_CONCERN)
+    ops = iter(ops)
+    upserted = modified = 0
+    pending = set()
+
+    def collect(futures):
+        nonlocal upserted, modified
+        for future in futures:
+            result = future.result()
+            upserted += result.upserted_count
+            modified += result.modified_count
+
+    with ThreadPoolExecutor(max_workers=BULK_WRITE_WORKERS) as executor:
+        while True:
+            batch = list(islice(ops, BULK_BATCH_SIZE))
+            if not batch:
+                break
+            if len(pending) >= BULK_WRITE_WORKERS:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+            pending.add(executor.submit(collection.bulk_write, batch, ordered=False))
+        collect(pending)
+
+    return upserted, modified
+
+
+def find_war_zone(times):
+    """
+    Find the War Zone: the 0.1s lap time bucket with the most drivers.
+    Ties go to the faster bucket.
+
+    Returns:
+        Tuple of (bucket start time in seconds, driver count)
+    """
+    buckets = np.rint(times * 10).astype(np.int64)
+    first_bucket = buckets.min()
+    bucket_counts = np.bincount(buckets - first_bucket)
+    busiest = bucket_counts.argmax()
+    return float(first_bucket + busiest) / 10, int(bucket_counts[busiest])
+
+
+def lap_record_filter(lap_record):
+    """Build the upsert filter matching a lap record on its unique key."""
+    filter_query = {'trackSlug': lap_record['trackSlug'], 'driverSlug': lap_record['driverSlug']}
+    if lap_record['kartType']:
+        filter_query['kartType'] = lap_record['kartType']
+    return filter_query
+
+
+def content_hash(document):
+    """Hash of a document's BSON encoding, stored to detect unchanged records."""
+    return hashlib.blake2b(encode(document), digest_size=16).hexdigest()
+
+
+def lap_record_key(lap_record):
+    """Key of a lap record within its track; a missing kart type keys as None."""
+    kart_type = lap_record.get('kartType')
+    return lap_record['driverSlug'], kart_type if isinstance(kart_type, str) else None
+
+
+def encode_documents(documents):
+    """
+    Encode documents to BSON up front in one pass. insert_many sends
+    RawBSONDocuments as-is, without another encode. The server assigns
+    their _id, and they are not listed in InsertManyResult.inserted_ids.
+    """
+    return [RawBSONDocument(encode(document)) for document in documents]
+
+
+def merge_lap_records(track_slug, lap_records):
+    """
+    Side-load lap records into a per-track staging collection, then upsert them
+    into laprecords server-side with $merge on the (trackSlug, driverSlug, kartType)
+    unique index. Each document is sent once, with no per-row filter or update
+    document. Matched documents keep their _id and createdAt.
+
+    Returns:
+        Number of lap records merged
+    """
+    staging_col = db.get_collection(
+        f'{records_col.name}_staging_{track_slug}', write_concern=BULK_WRITE_CONCERN
+    )
+    staged_records = encode_documents(lap_records)
+    if not staged_records:
+        return 0
+
+    staging_col.drop()
+    staging_col.insert_many(staged_records, ordered=False)
+
+    staging_col.aggregate([
+        {'$project': {'_id': 0}},
+        {'$set': {'createdAt': '$updatedAt'}},
+        {'$merge': {
+            'into': records_col.name,
+            'on': ['trackSlug', 'driverSlug', 'kartType'],
+            'whenMatched': [{
+                '$replaceWith': {
+                    '$mergeObjects': [
+                        '$$ROOT',
+                        '$$new',
+                        {'createdAt': {'$ifNull': ['$createdAt', '$$new.createdAt']}}
+                    ]
+                }
+            }],
+            'whenNotMatched': 'insert'
+        }}
+    ])
+    staging_col.drop()
+
+    return len(staged_records)
+
+
+def find_record_holders(df, kart_type, slug_map, now):
+    """
+    Find the successive record holders, oldest first, for one kart type (or a
+    whole track). A lap sets a record when it beats every earlier lap; the
+    running best comes from np.minimum.accumulate over the date-sorted times.
+    Each record reigns until the next one is set, the current one until now.
+    """
+    df = df.sort_values('date_obj')  # Sort by date chronologically
+    times = df['best_time_seconds'].to_numpy()
+    best_so_far = np.minimum.accumulate(times)
+
+    is_record = np.empty(len(times), dtype=bool)
+    is_record[:1] = True
+    is_record[1:] = times[1:] < best_so_far[:-1]
+    record_rows = df[is_record]
+
+    # Whole days between consecutive record dates, with now closing the last reign
+    record_dates = record_rows['date_obj'].to_numpy(dtype='datetime64[us]')
+    reign_days = np.floor(
+        np.diff(np.append(record_dates, np.datetime64(now, 'us'))) / np.timedelta64(1, 'D')
+    )
+    last = len(record_rows) - 1
+
+    return [
+        {
+            'dateBroken': date_broken,
+            'driverName': driver_name,
+            'driverSlug': slug_map[driver_name],
+            'profileUrl': profile_url,
+            'recordTime': time,
+            'recordTimeStr': format_seconds_to_time(time),
+            'kartType': kart_type,
+            'daysReigned': days if np.isnan(days) else int(days),  # NaN when a date is missing
+            'isCurrent': i == last
+        }
+        for i, (date_broken, driver_name, profile_url, time, days) in enumerate(zip(
+            record_rows['date_obj'].tolist(),
+            record_rows['Name'].tolist(),
+            record_rows['Profile URL'].tolist(),
+            record_rows['best_time_seconds'].tolist(),
+            reign_days.tolist()
+        ))
+    ]
+
+
+def hall_of_fame_id(track_slug, record):
+    """Deterministic _id for a Hall of Fame record, hashed from its track, kart type, date and time."""
+    key = f"{track_slug}|{record['kartType']}|{record['dateBroken'].isoformat()}|{record['recordTime']!r}"
+    return hashlib.md5(key.encode()).hexdigest()
+
+
+def calculate_hall_of_fame(df, track_id, track_slug, slug_map, now):
+    """
+    Calculate World Record history (Hall of Fame) for a track.
+    Reuses sync_track's driver slug map and sync timestamp.
+    """
     print("\nCalculating Hall of Fame (World Record History)...")
 
     # Check if track has kart types
@@ -132,77 +370,17 @@ def calculate_hall_of_fame(df, track_id, track_slug):
 
     if has_kart_types:
         # Process each kart type separately
-        kart_types = df[df['Kart Type'].notna()]['Kart Type'].unique()
+        kart_types = df[df['Kart Type'].notna()]['Kart Type'].unique().tolist()
 
         for kart_type in kart_types:
-            kart_df = df[df['Kart Type'] == kart_type].copy()
-            kart_df = kart_df.sort_values('date_obj')  # Sort by date chronologically
-
-            current_record = 9999.0  # Start with impossibly high time
-            record_holders = []
-
-            for _, row in kart_df.iterrows():
-                time = row['best_time_seconds']
-                if time < current_record:
-                    current_record = time
-                    record_holders.append({
-                        'dateBroken': row['date_obj'],
-                        'driverName': row['Name'],
-                        'driverSlug': create_slug(row['Name']),
-                        'profileUrl': row['Profile URL'],
-                        'recordTime': time,
-                        'recordTimeStr': format_seconds_to_time(time),
-                        'kartType': kart_type
-                    })
-
-            # Calculate days reigned for each record holder
-            for i in range(len(record_holders)):
-                if i < len(record_holders) - 1:
-                    # Calculate days between this record and next
-                    next_date = record_holders[i + 1]['dateBroken']
-                    days_reigned = (next_date - record_holders[i]['dateBroken']).days
-                else:
-                    # Current WR holder - calculate days until today
-                    days_reigned = (datetime.utcnow() - record_holders[i]['dateBroken'].replace(tzinfo=None)).days
-
-                record_holders[i]['daysReigned'] = days_reigned
-                record_holders[i]['isCurrent'] = (i == len(record_holders) - 1)
-
+            record_holders = find_record_holders(df[df['Kart Type'] == kart_type], kart_type, slug_map, now)
             hall_of_fame_records.extend(record_holders)
             print(f"  {kart_type}: {len(record_holders)} WR holders")
 
     else:
         # No kart types - calculate for entire track
-        df_sorted = df.sort_values('date_obj').copy()
-
-        current_record = 9999.0
-        record_holders = []
-
-        for _, row in df_sorted.iterrows():
-            time = row['best_time_seconds']
-            if time < current_record:
-                current_record = time
-                record_holders.append({
-                    'dateBroken': row['date_obj'],
-                    'driverName': row['Name'],
-                    'driverSlug': create_slug(row['Name']),
-                    'profileUrl': row['Profile URL'],
-                    'recordTime': time,
-                    'recordTimeStr': format_seconds_to_time(time),
-                    'kartType': None
-                })
-
-        # Calculate days reigned
-        for i in range(len(record_holders)):
-            if i < len(record_holders) - 1:
-                next_date = record_holders[i + 1]['dateBroken']
-                days_reigned = (next_date - record_holders[i]['dateBroken']).days
-            else:
-                days_reigned = (datetime.utcnow() - record_holders[i]['dateBroken'].replace(tzinfo=None)).days
-
-            record_holders[i]['daysReigned'] = days_reigned
-            record_holders[i]['isCurrent'] = (i == len(record_holders) - 1)
-
+        kart_types = [None]
+        record_holders = find_record_holders(df, None, slug_map, now)
         hall_of_fame_records = record_holders
         print(f"  Total: {len(record_holders)} WR holders")
 
@@ -210,11 +388,8 @@ def calculate_hall_of_fame(df, track_id, track_slug):
     if hall_of_fame_records:
         print(f"  Upserting {len(hall_of_fame_records)} Hall of Fame records...")
 
-        # First, mark all existing records as not current
-        worldrecordhistory_col.update_many(
-            {'trackSlug': track_slug},
-            {'$set': {'isCurrent': False}}
-        )
+        hall_of_fame_ops = []
+        hall_of_fame_ids = []
 
         for record in hall_of_fame_records:
             record_doc = {
@@ -229,25 +404,33 @@ def calculate_hall_of_fame(df, track_id, track_slug):
                 'dateBroken': record['dateBroken'],
                 'daysReigned': record['daysReigned'],
                 'isCurrent': record['isCurrent'],
-                'updatedAt': datetime.utcnow()
+                'updatedAt': now
             }
 
-            filter_query = {
-                'trackSlug': track_slug,
-                'dateBroken': record['dateBroken'],
-                'recordTime': record['recordTime']
-            }
-            if record['kartType']:
-                filter_query['kartType'] = record['kartType']
-            else:
-                filter_query['kartType'] = None
-
-            worldrecordhistory_col.update_one(
-                filter_query,
-                {'$set': record_doc, '$setOnInsert': {'createdAt': datetime.utcnow()}},
-                upsert=True
+            # Upsert by a deterministic _id so each op is a single _id lookup
+            record_id = hall_of_fame_id(track_slug, record)
+            hall_of_fame_ids.append(record_id)
+            hall_of_fame_ops.append(
+                UpdateOne(
+                    {'_id': record_id},
+                    {'$set': record_doc, '$setOnInsert': {'createdAt': now}},
+                    upsert=True
+                )
             )
 
+        # Every record carries its isCurrent flag, so instead of resetting the
+        # flags first just remove records that are no longer in the history of
+        # the kart types recomputed above; kart types whose CSV rows are missing
+        # this run keep their history
+        hall_of_fame_ops.append(
+            DeleteMany({
+                'trackSlug': track_slug,
+                'kartType': {'$in': kart_types},
+                '_id': {'$nin': hall_of_fame_ids}
+            })
+        )
+
+        worldrecordhistory_col.bulk_write(hall_of_fame_ops, ordered=False)
         print(f"  [OK] Hall of Fame records upserted successfully")
 
     return len(hall_of_fame_records)
@@ -259,35 +442,44 @@ def sync_track(track_info):
     print(f"Processing: {track_info['name']}")
     print(f"{'='*60}")
 
+    # One timestamp for the whole track sync, shared by every document written
+    now = datetime.utcnow()
+
     # Handle both single csv_path and multiple csv_paths
     if 'csv_paths' in track_info:
         # Multiple CSV files (e.g., different kart types)
-        dfs = []
+        csv_paths = []
         for csv_rel_path in track_info['csv_paths']:
-            csv_path = Path(__file__).parent.parent / csv_rel_path
+            csv_path = BASE_DIR / csv_rel_path
             if not csv_path.exists():
                 print(f"Warning: CSV file not found at {csv_path}, skipping...")
                 continue
             print(f"Reading CSV from: {csv_path}")
-            df_temp = pd.read_csv(csv_path)
-            dfs.append(df_temp)
+            csv_paths.append(csv_path)
 
-        if not dfs:
+        if not csv_paths:
             print(f"Error: No valid CSV files found for {track_info['name']}")
             return
 
-        # Combine all dataframes
+        # Read the files concurrently (the C parser releases the GIL), keeping order
+        with ThreadPoolExecutor(max_workers=len(csv_paths)) as executor:
+            dfs = list(executor.map(read_track_csv, csv_paths))
+
+        # Combine all dataframes in a single concat. Kart Type categories differ
+        # per file, so concat falls back to object; make it categorical again.
         df = pd.concat(dfs, ignore_index=True)
+        if 'Kart Type' in df.columns:
+            df['Kart Type'] = df['Kart Type'].astype('category')
         print(f"Loaded {len(df)} total records from {len(dfs)} CSV files")
     else:
         # Single CSV file (backward compatibility for Apex)
-        csv_path = Path(__file__).parent.parent / track_info['csv_path']
+        csv_path = BASE_DIR / track_info['csv_path']
         if not csv_path.exists():
             print(f"Error: CSV file not found at {csv_path}")
             return
 
         print(f"Reading CSV from: {csv_path}")
-        df = pd.read_csv(csv_path)
+        df = read_track_csv(csv_path)
         print(f"Loaded {len(df)} records")
 
     # Clean data
@@ -301,10 +493,10 @@ def sync_track(track_info):
     war_zones_data = []
 
     # Parse times to seconds
-    df['best_time_seconds'] = df['Best Time'].apply(parse_time_to_seconds)
+    df['best_time_seconds'] = parse_times_to_seconds(df['Best Time'])
 
     # Parse dates
-    df['date_obj'] = df['Date'].apply(parse_date)
+    df['date_obj'] = parse_dates(df['Date'])
 
     # Filter out invalid times (0 or negative) and outliers (> 1:45)
     df = df[df['best_time_seconds'] > 0]
@@ -312,33 +504,33 @@ def sync_track(track_info):
     df = df[df['best_time_seconds'] <= CUTOFF_SECONDS]
     print(f"After filtering (< 01:45.000): {len(df)} records")
 
+    # Slugify each driver name once; many drivers appear on several kart types
+    slug_map = {name: create_slug(name) for name in df['Name'].unique()}
+
     # Calculate track-level statistics (for overall track stats)
     print("\nCalculating track statistics...")
-    median_time = df['best_time_seconds'].median()
-    world_record = df['best_time_seconds'].min()
-    slowest_time = df['best_time_seconds'].max()
+    times = df['best_time_seconds'].to_numpy()
     total_drivers = len(df)
 
-    # Calculate percentiles
-    top_1_percent_time = df['best_time_seconds'].quantile(0.01)
-    top_5_percent_time = df['best_time_seconds'].quantile(0.05)
-    top_10_percent_time = df['best_time_seconds'].quantile(0.10)
+    # Min, percentiles, median and max in a single pass over the times
+    (world_record, top_1_percent_time, top_5_percent_time, top_10_percent_time,
+     median_time, slowest_time) = np.quantile(times, [0.0, 0.01, 0.05, 0.10, 0.5, 1.0])
 
     # Find most common time (mode with binning)
-    time_bins = pd.cut(df['best_time_seconds'], bins=20)
-    mode_bin = time_bins.value_counts().idxmax()
-    meta_time = (mode_bin.left + mode_bin.right) / 2
+    bin_counts, bin_edges = np.histogram(times, bins=20)
+    mode_bin = bin_counts.argmax()
+    meta_time = (bin_edges[mode_bin] + bin_edges[mode_bin + 1]) / 2
 
-    # Find record holder
-    record_row = df.loc[df['best_time_seconds'].idxmin()]
-    record_holder = record_row['Name']
-    record_holder_slug = create_slug(record_holder)
+    # Find record holder by position, reusing the times array
+    record_holder = df['Name'].iat[times.argmin()]
+    record_holder_slug = slug_map[record_holder]
 
     # Get available kart types for this track (if any)
     available_kart_types = []
     has_kart_types = 'Kart Type' in df.columns and df['Kart Type'].notna().any()
     if has_kart_types:
-        available_kart_types = sorted(df['Kart Type'].dropna().unique().tolist())
+        # Categories are the distinct kart types; drop ones only seen in filtered-out rows
+        available_kart_types = sorted(df['Kart Type'].cat.remove_unused_categories().cat.categories.tolist())
 
     print(f"World Record: {format_seconds_to_time(world_record)} by {record_holder}")
     print(f"Total Drivers: {total_drivers}")
@@ -346,29 +538,56 @@ def sync_track(track_info):
     if available_kart_types:
         print(f"Available Kart Types: {', '.join(available_kart_types)}")
 
+    # A driver can appear twice for the same kart type (historical + latest CSVs,
+    # namesakes). Only the last row is upserted, as the sequential upserts used to
+    # leave it, so parallel batches never race on one document.
+    driver_slugs = [slug_map[name] for name in df['Name'].tolist()]
+    kart_types = df['Kart Type'].tolist() if 'Kart Type' in df.columns else [None] * len(df)
+    keep_rows = ~pd.DataFrame({'slug': driver_slugs, 'kart': kart_types}).duplicated(keep='last').to_numpy()
+
+    # Sort once by (kart type, time), ties keeping file order. Each kart type is
+    # a contiguous run of this order, reused for its stats, record holder,
+    # percentiles and intervals. Rows without a kart type get code -1.
+    if has_kart_types:
+        kart_codes = df['Kart Type'].cat.set_categories(available_kart_types).cat.codes.to_numpy()
+    else:
+        kart_codes = np.zeros(total_drivers, dtype=np.int64)
+    order = np.lexsort((times, kart_codes))
+    sorted_times = times[order]
+    sorted_codes = kart_codes[order]
+
+    # The same order restricted to the kept rows, so percentiles and intervals
+    # rank each stored record against other stored records only
+    ranked_order = order[keep_rows[order]]
+    ranked_times = times[ranked_order]
+    ranked_codes = kart_codes[ranked_order]
+
     # Calculate z-scores and tiers PER KART TYPE
     print("\nCalculating tiers per kart type...")
 
     # Initialize columns
-    df['z_score'] = 0.0
-    df['tier'] = 'D'
-    df['percentile'] = 0.0
+    z_scores = np.zeros(total_drivers)
+    tiers = np.full(total_drivers, 'D', dtype=object)
+    percentiles = np.zeros(total_drivers)
 
     stats_by_kart_type = {}  # Store per-kart-type statistics
 
     if has_kart_types:
         # Process each kart type separately
-        for kart_type in available_kart_types:
-            kart_mask = df['Kart Type'] == kart_type
-            kart_df = df[kart_mask]
+        for kart_code, kart_type in enumerate(available_kart_types):
+            start, end = np.searchsorted(sorted_codes, [kart_code, kart_code + 1])
+            kart_rows = order[start:end]
+            kart_times = sorted_times[start:end]  # Fastest first
 
-            if len(kart_df) == 0:
+            if len(kart_rows) == 0:
                 continue
 
             # Calculate statistics for this kart type
-            kart_mean = kart_df['best_time_seconds'].mean()
-            kart_std = kart_df['best_time_seconds'].std()
-            kart_count = len(kart_df)
+            kart_mean = kart_times.mean()
+            kart_std = kart_times.std(ddof=1)
+            kart_count = len(kart_rows)
+            (kart_wr, kart_top_1, kart_top_5, kart_top_10,
+             kart_median, kart_slowest) = np.quantile(kart_times, [0.0, 0.01, 0.05, 0.10, 0.5, 1.0])
 
             print(f"\n  {kart_type}:")
             print(f"    Drivers: {kart_count}")
@@ -376,93 +595,73 @@ def sync_track(track_info):
             print(f"    Std Dev: {kart_std:.3f}s")
 
             # Calculate z-scores and tiers for this kart type
-            df.loc[kart_mask, 'z_score'] = kart_df['best_time_seconds'].apply(
-                lambda t: calculate_z_score(t, kart_mean, kart_std)
+            kart_z_scores = calculate_z_scores(kart_times, kart_mean, kart_std)
+            kart_tiers = assign_tiers(kart_z_scores)
+            z_scores[kart_rows] = kart_z_scores
+            tiers[kart_rows] = kart_tiers
+
+            # Percentiles within this kart type from each kept driver's position in the run
+            ranked_start, ranked_end = np.searchsorted(ranked_codes, [kart_code, kart_code + 1])
+            ranked_count = ranked_end - ranked_start
+            percentiles[ranked_order[ranked_start:ranked_end]] = calculate_percentiles(
+                np.arange(1, ranked_count + 1), ranked_count
             )
-            df.loc[kart_mask, 'tier'] = df.loc[kart_mask, 'z_score'].apply(assign_tier)
-
-            # Calculate percentiles within this kart type
-            # Reset position to be within kart type
-            kart_df_sorted = kart_df.sort_values('best_time_seconds').reset_index(drop=True)
-            kart_df_sorted['kart_position'] = range(1, len(kart_df_sorted) + 1)
-
-            for idx in kart_df_sorted.index:
-                original_idx = kart_df_sorted.loc[idx, 'index'] if 'index' in kart_df_sorted.columns else kart_df_sorted.iloc[idx].name
-                kart_position = kart_df_sorted.loc[idx, 'kart_position']
-                percentile = calculate_percentile(kart_position, kart_count)
-                df.loc[df.index == original_idx, 'percentile'] = percentile
 
             # Print tier distribution for this kart type
-            tier_counts = df.loc[kart_mask, 'tier'].value_counts().sort_index()
             print(f"    Tier Distribution:")
-            for tier, count in tier_counts.items():
+            for tier, count in zip(*np.unique(kart_tiers, return_counts=True)):
                 percentage = (count / kart_count) * 100
                 print(f"      {tier}: {count:4d} drivers ({percentage:5.2f}%)")
 
             # Calculate full statistics for this kart type
-            kart_wr = kart_df['best_time_seconds'].min()
-            kart_record_row = kart_df.loc[kart_df['best_time_seconds'].idxmin()]
-            kart_record_holder = kart_record_row['Name']
+            kart_record_holder = df['Name'].iat[kart_rows[0]]
 
             stats_by_kart_type[kart_type] = {
                 'totalDrivers': int(kart_count),
                 'worldRecord': float(kart_wr),
                 'worldRecordStr': format_seconds_to_time(kart_wr),
                 'recordHolder': kart_record_holder,
-                'recordHolderSlug': create_slug(kart_record_holder),
-                'median': float(kart_df['best_time_seconds'].median()),
-                'slowest': float(kart_df['best_time_seconds'].max()),
-                'top1Percent': float(kart_df['best_time_seconds'].quantile(0.01)),
-                'top5Percent': float(kart_df['best_time_seconds'].quantile(0.05)),
-                'top10Percent': float(kart_df['best_time_seconds'].quantile(0.10)),
+                'recordHolderSlug': slug_map[kart_record_holder],
+                'median': float(kart_median),
+                'slowest': float(kart_slowest),
+                'top1Percent': float(kart_top_1),
+                'top5Percent': float(kart_top_5),
+                'top10Percent': float(kart_top_10),
                 'mean': float(kart_mean),
                 'stdDev': float(kart_std)
             }
 
             # Calculate War Zone for this kart type
-            kart_df['time_bucket'] = (kart_df['best_time_seconds'] * 10).round() / 10
-            bucket_counts = kart_df['time_bucket'].value_counts()
-            if len(bucket_counts) > 0:
-                war_zone_time = bucket_counts.idxmax()
-                war_zone_count = int(bucket_counts.max())
-                war_zones_data.append({
-                    'kartType': kart_type,
-                    'timeStart': war_zone_time,
-                    'timeEnd': war_zone_time + 0.1,
-                    'driverCount': war_zone_count
-                })
-                print(f"    War Zone: {format_seconds_to_time(war_zone_time)} - {format_seconds_to_time(war_zone_time + 0.1)} ({war_zone_count} drivers)")
+            war_zone_time, war_zone_count = find_war_zone(kart_times)
+            war_zones_data.append({
+                'kartType': kart_type,
+                'timeStart': war_zone_time,
+                'timeEnd': war_zone_time + 0.1,
+                'driverCount': war_zone_count
+            })
+            print(f"    War Zone: {format_seconds_to_time(war_zone_time)} - {format_seconds_to_time(war_zone_time + 0.1)} ({war_zone_count} drivers)")
     else:
         # No kart types - calculate for entire track
-        mean_time = df['best_time_seconds'].mean()
-        std_dev = df['best_time_seconds'].std()
+        mean_time = times.mean()
+        std_dev = times.std(ddof=1)
 
         print(f"Mean: {format_seconds_to_time(mean_time)}")
         print(f"Std Dev: {std_dev:.3f}s")
 
-        df['z_score'] = df['best_time_seconds'].apply(
-            lambda t: calculate_z_score(t, mean_time, std_dev)
-        )
-        df['tier'] = df['z_score'].apply(assign_tier)
+        z_scores = calculate_z_scores(times, mean_time, std_dev)
+        tiers = assign_tiers(z_scores)
 
-        df['percentile'] = df.apply(
-            lambda row: calculate_percentile(row['Position'], total_drivers),
-            axis=1
-        )
+        percentiles = calculate_percentiles(df['Position'].to_numpy(), total_drivers)
 
         # Print tier distribution
-        tier_counts = df['tier'].value_counts().sort_index()
         print("\nTier Distribution:")
-        for tier, count in tier_counts.items():
+        for tier, count in zip(*np.unique(tiers, return_counts=True)):
             percentage = (count / total_drivers) * 100
             print(f"  {tier}: {count:4d} drivers ({percentage:5.2f}%)")
 
         # Calculate War Zone for entire track (no kart types)
-        df['time_bucket'] = (df['best_time_seconds'] * 10).round() / 10
-        bucket_counts = df['time_bucket'].value_counts()
-        if len(bucket_counts) > 0:
-            war_zone_time = bucket_counts.idxmax()
-            war_zone_count = int(bucket_counts.max())
+        if len(times) > 0:
+            war_zone_time, war_zone_count = find_war_zone(times)
             war_zones_data.append({
                 'kartType': None,
                 'timeStart': war_zone_time,
@@ -471,9 +670,19 @@ def sync_track(track_info):
             })
             print(f"\nWar Zone: {format_seconds_to_time(war_zone_time)} - {format_seconds_to_time(war_zone_time + 0.1)} ({war_zone_count} drivers)")
 
-    # Calculate gaps and intervals (these remain track-level)
-    df['gap_to_p1'] = df['best_time_seconds'] - world_record
-    df['interval'] = df['best_time_seconds'].diff().fillna(0)
+    df['z_score'] = z_scores
+    df['tier'] = tiers
+    df['percentile'] = percentiles
+
+    # Calculate gaps (track-level) and intervals. The interval is the gap to the
+    # next faster kept driver on the same kart type, so it does not depend on the
+    # order the CSV rows were concatenated in.
+    same_kart = ranked_codes[1:] == ranked_codes[:-1]
+    intervals = np.zeros(total_drivers)
+    intervals[ranked_order[1:]] = np.where(same_kart, np.diff(ranked_times), 0.0)
+
+    df['gap_to_p1'] = times - world_record
+    df['interval'] = intervals
 
     # Upsert track document
     print(f"\nUpserting track document...")
@@ -485,34 +694,31 @@ def sync_track(track_info):
         'kartTypes': available_kart_types,  # Add available kart types
         'stats': {
             'totalDrivers': total_drivers,
-            'worldRecord': world_record,
+            'worldRecord': float(world_record),
             'worldRecordStr': format_seconds_to_time(world_record),
             'recordHolder': record_holder,
             'recordHolderSlug': record_holder_slug,
-            'top1Percent': top_1_percent_time,
-            'top5Percent': top_5_percent_time,
-            'top10Percent': top_10_percent_time,
-            'median': median_time,
-            'slowest': slowest_time,
-            'metaTime': meta_time,
-            'lastUpdated': datetime.utcnow()
+            'top1Percent': float(top_1_percent_time),
+            'top5Percent': float(top_5_percent_time),
+            'top10Percent': float(top_10_percent_time),
+            'median': float(median_time),
+            'slowest': float(slowest_time),
+            'metaTime': float(meta_time),
+            'lastUpdated': now
         },
         'statsByKartType': stats_by_kart_type,  # Add per-kart-type statistics
-        'updatedAt': datetime.utcnow()
+        'updatedAt': now
     }
 
-    result = tracks_col.update_one(
+    # Upsert and read back the _id in one round trip
+    track_id = tracks_col.find_one_and_update(
         {'slug': track_slug},
-        {'$set': track_doc, '$setOnInsert': {'createdAt': datetime.utcnow()}},
-        upsert=True
-    )
-
-    if result.upserted_id:
-        print(f"Created new track document")
-        track_id = result.upserted_id
-    else:
-        print(f"Updated existing track document")
-        track_id = tracks_col.find_one({'slug': track_slug})['_id']
+        {'$set': track_doc, '$setOnInsert': {'createdAt': now}},
+        projection={'_id': 1},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )['_id']
+    print(f"Upserted track document")
 
     # Upsert War Zone data
     print(f"\nUpserting {len(war_zones_data)} war zone(s)...")
@@ -521,10 +727,10 @@ def sync_track(track_info):
             'trackId': track_id,
             'trackSlug': track_slug,
             'kartType': wz_data['kartType'],
-            'timeStart': wz_data['timeStart'],
-            'timeEnd': wz_data['timeEnd'],
+            'timeStart': float(wz_data['timeStart']),
+            'timeEnd': float(wz_data['timeEnd']),
             'driverCount': wz_data['driverCount'],
-            'updatedAt': datetime.utcnow()
+            'updatedAt': now
         }
 
         filter_query = {'trackSlug': track_slug}
@@ -535,165 +741,163 @@ def sync_track(track_info):
 
         warzones_col.update_one(
             filter_query,
-            {'$set': wz_doc, '$setOnInsert': {'createdAt': datetime.utcnow()}},
+            {'$set': wz_doc, '$setOnInsert': {'createdAt': now}},
             upsert=True
         )
     print(f"[OK] War zones upserted successfully")
 
     # Calculate and store Hall of Fame
-    hall_of_fame_count = calculate_hall_of_fame(df, track_id, track_slug)
+    hall_of_fame_count = calculate_hall_of_fame(df, track_id, track_slug, slug_map, now)
 
     # Process drivers using bulk operations for performance
     print(f"\nProcessing {len(df)} drivers with bulk operations...")
 
-    # Prepare bulk operations for lap records
-    lap_record_ops = []
     driver_data = {}  # Store driver info keyed by slug
 
-    for idx, row in df.iterrows():
-        driver_name = row['Name']
-        driver_slug = create_slug(driver_name)
-        profile_url = row['Profile URL']
-        kart_type = row.get('Kart Type')
-
-        # Helper function to safely convert to numeric
-        def safe_int(value):
-            if pd.isna(value):
-                return None
-            try:
-                return int(float(value))
-            except (ValueError, TypeError):
-                return None
-
-        def safe_float(value):
-            if pd.isna(value):
-                return None
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return None
-
-        # Create lap record document
-        lap_record = {
-            'trackId': track_id,
-            'trackName': track_info['name'],
-            'trackSlug': track_slug,
-            'driverName': driver_name,
-            'driverSlug': driver_slug,
-            'profileUrl': profile_url,
-            'position': int(row['Position']),
-            'bestTime': row['best_time_seconds'],
-            'bestTimeStr': row['Best Time'],
-            'date': row['date_obj'],
-            'maxKmh': safe_int(row['Max km/h']),
-            'maxG': safe_float(row['Max G']),
-            'kartType': kart_type,
-            'tier': row['tier'],
-            'percentile': row['percentile'],
-            'gapToP1': row['gap_to_p1'],
-            'interval': row['interval'],
-            'zScore': row['z_score'],
-            'updatedAt': datetime.utcnow()
-        }
+    # Pull each column out once and iterate over plain Python values
+    columns = [
+        df['Name'].tolist(),
+        driver_slugs,
+        df['Profile URL'].tolist(),
+        kart_types,
+        df['Position'].tolist(),
+        df['best_time_seconds'].tolist(),
+        df['Best Time'].tolist(),
+        df['date_obj'].tolist(),
+        [safe_int(value) for value in df['Max km/h'].tolist()],
+        [safe_float(value) for value in df['Max G'].tolist()],
+        df['tier'].tolist(),
+        df['percentile'].tolist(),
+        df['gap_to_p1'].tolist(),
+        df['interval'].tolist(),
+        df['z_score'].tolist()
+    ]
+
+    # Content hashes of the lap records already stored for this track
+    stored_hashes = {
+        lap_record_key(doc): doc.get('contentHash')
+        for doc in records_col.find(
+            {'trackSlug': track_slug},
+            {'_id': 0, 'driverSlug': 1, 'kartType': 1, 'contentHash': 1}
+        )
+    }
+    unchanged_records = 0
+
+    def generate_lap_records():
+        """
+        Yield one lap record document per kept row, building them lazily as they
+        are sent. Records whose content hash matches the stored one are skipped.
+        """
+        nonlocal unchanged_records
+        for keep, (driver_name, driver_slug, profile_url, kart_type, position, best_time, best_time_str,
+                   date, max_kmh, max_g, tier, percentile, gap_to_p1, interval, z_score) in zip(keep_rows, zip(*columns)):
+            if not keep:
+                continue
 
-        # Build filter query for lap record
-        filter_query = {'trackSlug': track_slug, 'driverSlug': driver_slug}
-        if kart_type:
-            filter_query['kartType'] = kart_type
+            # Create lap record document
+            lap_record = {
+                'trackId': track_id,
+                'trackName': track_info['name'],
+                'trackSlug': track_slug,
+                'driverName': driver_name,
+                'driverSlug': driver_slug,
+                'profileUrl': profile_url,
+                'position': int(position),
+                'bestTime': best_time,
+                'bestTimeStr': best_time_str,
+                'date': date,
+                'maxKmh': max_kmh,
+                'maxG': max_g,
+                'kartType': kart_type,
+                'tier': tier,
+                'percentile': percentile,
+                'gapToP1': gap_to_p1,
+                'interval': interval,
+                'zScore': z_score
+            }
 
-        # Add to bulk operations
-        lap_record_ops.append(
-            UpdateOne(
-                filter_query,
-                {'$set': lap_record, '$setOnInsert': {'createdAt': datetime.utcnow()}},
-                upsert=True
-            )
-        )
+            # Hash everything but the timestamps; unchanged records are not rewritten
+            lap_record['contentHash'] = content_hash(lap_record)
+            if stored_hashes.get(lap_record_key(lap_record)) == lap_record['contentHash']:
+                unchanged_records += 1
+                continue
 
-        # Store driver record data
-        driver_record = {
-            'trackId': track_id,
-            'trackName': track_info['name'],
-            'trackSlug': track_slug,
-            'position': int(row['Position']),
-            'bestTime': row['best_time_seconds'],
-            'bestTimeStr': row['Best Time'],
-            'date': row['date_obj'],
-            'maxKmh': safe_int(row['Max km/h']),
-            'maxG': safe_float(row['Max G']),
-            'kartType': kart_type,
-            'tier': row['tier'],
-            'percentile': row['percentile'],
-            'gapToP1': row['gap_to_p1'],
-            'interval': row['interval']
-        }
+            lap_record['updatedAt'] = now
+            yield lap_record
 
-        # Group records by driver slug
+    # Keep the first name and profile URL seen for each driver slug
+    for driver_name, driver_slug, profile_url in zip(*columns[:3]):
         if driver_slug not in driver_data:
             driver_data[driver_slug] = {
                 'name': driver_name,
-                'profileUrl': profile_url,
-                'records': []
+                'profileUrl': profile_url
             }
-        driver_data[driver_slug]['records'].append(driver_record)
 
-    # Execute bulk lap record operations
-    print(f"  Upserting {len(lap_record_ops)} lap records...")
+    # Write lap records, streaming documents from the generator
+    lap_record_count = int(keep_rows.sum())
     records_created = 0
-    if lap_record_ops:
-        result = records_col.bulk_write(lap_record_ops, ordered=False)
-        records_created = result.upserted_count + result.modified_count
-        print(f"  [OK] Lap records: {result.upserted_count} inserted, {result.modified_count} updated")
+    if lap_record_count and not stored_hashes:
+        # First sync of this track: there is nothing to match, so skip the
+        # upsert lookups and insert the documents directly
+        print(f"  Inserting {lap_record_count} lap records (first sync of this track)...")
+        new_records = encode_documents(
+            dict(lap_record, createdAt=now) for lap_record in generate_lap_records()
+        )
+        records_col.with_options(write_concern=BULK_WRITE_CONCERN).insert_many(new_records, ordered=False)
+        records_created = len(new_records)
+        print(f"  [OK] Lap records: {records_created} inserted")
+    elif lap_record_count and all(isinstance(kart_type, str) for kart_type in kart_types):
+        print(f"  Upserting {lap_record_count} lap records...")
+        records_created = merge_lap_records(track_slug, generate_lap_records())
+        print(f"  [OK] Lap records: {records_created} merged, {unchanged_records} unchanged")
+    elif lap_record_count:
+        # $merge needs a non-null kartType on every record; upsert one by one instead
+        print(f"  Upserting {lap_record_count} lap records...")
+        lap_record_ops = (
+            UpdateOne(
+                lap_record_filter(lap_record),
+                {'$set': lap_record, '$setOnInsert': {'createdAt': now}},
+                upsert=True
+            )
+            for lap_record in generate_lap_records()
+        )
+        upserted, modified = bulk_write_batched(records_col, lap_record_ops)
+        records_created = upserted + modified
+        print(f"  [OK] Lap records: {upserted} inserted, {modified} updated, {unchanged_records} unchanged")
 
     # Process driver documents in batches
     print(f"  Processing {len(driver_data)} unique drivers...")
     drivers_processed = 0
-    driver_ops_pull = []
-    driver_ops_push = []
+    driver_ops = []
 
     for driver_slug, driver_info in driver_data.items():
-        # First operation: upsert driver and pull old records for this track
-        for record in driver_info['records']:
-            pull_filter = {
-                'trackSlug': track_slug,
-                'kartType': record['kartType']
-            }
-
-            driver_ops_pull.append(
-                UpdateOne(
-                    {'slug': driver_slug},
-                    {
-                        '$set': {
-                            'name': driver_info['name'],
-                            'slug': driver_slug,
-                            'profileUrl': driver_info['profileUrl'],
-                            'updatedAt': datetime.utcnow()
-                        },
-                        '$setOnInsert': {'createdAt': datetime.utcnow()},
-                        '$pull': {'records': pull_filter}
-                    },
-                    upsert=True
-                )
-            )
-
-        # Second operation: push new records
-        driver_ops_push.append(
+        # Driver documents only carry the profile; a driver's records are read
+        # from laprecords by driverSlug. Unset the old embedded records array.
+        # The slug comes from the filter on insert and is never $set, so the
+        # server retries the upsert when another track inserts the same driver
+        # concurrently instead of failing on the unique slug index.
+        driver_ops.append(
             UpdateOne(
                 {'slug': driver_slug},
-                {'$push': {'records': {'$each': driver_info['records']}}}
+                {
+                    '$set': {
+                        'name': driver_info['name'],
+                        'profileUrl': driver_info['profileUrl'],
+                        'updatedAt': now
+                    },
+                    '$setOnInsert': {'createdAt': now},
+                    '$unset': {'records': ''}
+                },
+                upsert=True
             )
         )
 
     # Execute driver bulk operations
-    if driver_ops_pull:
-        print(f"  Removing old records for {len(driver_ops_pull)} driver-track combinations...")
-        drivers_col.bulk_write(driver_ops_pull, ordered=False)
-
-    if driver_ops_push:
-        print(f"  Adding new records for {len(driver_ops_push)} drivers...")
-        result = drivers_col.bulk_write(driver_ops_push, ordered=False)
-        drivers_processed = result.modified_count
-        print(f"  [OK] Updated {drivers_processed} driver documents")
+    if driver_ops:
+        print(f"  Upserting {len(driver_ops)} driver profiles...")
+        upserted, modified = bulk_write_batched(drivers_col, driver_ops)
+        drivers_processed = upserted + modified
+        print(f"  [OK] Drivers: {upserted} inserted, {modified} updated")
 
     print(f"\n[OK] Track sync complete!")
     print(f"  - Drivers processed: {drivers_processed}")
@@ -710,49 +914,106 @@ def create_indexes():
     """Create database indexes for efficient querying."""
     print("\nCreating database indexes...")
 
-    # Track indexes
-    tracks_col.create_index([('slug', ASCENDING)], unique=True)
-
-    # Driver indexes
-    drivers_col.create_index([('slug', ASCENDING)], unique=True)
-    drivers_col.create_index([('profileUrl', ASCENDING)])
-
-    # Drop old lap record index that doesn't include kartType
+    # Drop old lap record indexes: the unique index that doesn't include kartType,
+    # and driverSlug alone, now covered by the (driverSlug, trackSlug) index
     try:
-        print("Checking for old index without kartType...")
+        print("Checking for old lap record indexes...")
         existing_indexes = records_col.index_information()
-        if 'trackSlug_1_driverSlug_1' in existing_indexes:
-            print("Dropping old index 'trackSlug_1_driverSlug_1'...")
-            records_col.drop_index('trackSlug_1_driverSlug_1')
-            print("[OK] Old index dropped")
+        for old_index in ('trackSlug_1_driverSlug_1', 'driverSlug_1'):
+            if old_index in existing_indexes:
+                print(f"Dropping old index '{old_index}'...")
+                records_col.drop_index(old_index)
+                print("[OK] Old index dropped")
     except Exception as e:
         print(f"Note: Could not drop old index (may not exist): {e}")
 
-    # Lap record indexes
-    records_col.create_index([('trackId', ASCENDING), ('position', ASCENDING)])
-    records_col.create_index([('trackSlug', ASCENDING), ('position', ASCENDING)])
-    records_col.create_index([('driverSlug', ASCENDING)])
-    # Unique constraint includes kartType (allows same driver on different kart types)
-    records_col.create_index(
-        [('trackSlug', ASCENDING), ('driverSlug', ASCENDING), ('kartType', ASCENDING)],
-        unique=True
-    )
-    records_col.create_index([('tier', ASCENDING), ('trackId', ASCENDING)])
-    records_col.create_index([('trackSlug', ASCENDING), ('kartType', ASCENDING)])  # Index for kart type filtering
-    records_col.create_index([('kartType', ASCENDING)])
-
-    # War Zone indexes
-    warzones_col.create_index([('trackSlug', ASCENDING), ('kartType', ASCENDING)], unique=True)
-    warzones_col.create_index([('trackId', ASCENDING)])
+    # All indexes per collection; each list goes out as one createIndexes
+    # command so the server builds them with a single collection scan
+    index_models = {
+        tracks_col: [
+            IndexModel([('slug', ASCENDING)], unique=True)
+        ],
+        drivers_col: [
+            IndexModel([('slug', ASCENDING)], unique=True),
+            IndexModel([('profileUrl', ASCENDING)])
+        ],
+        records_col: [
+            IndexModel([('trackId', ASCENDING), ('position', ASCENDING)]),
+            IndexModel([('trackSlug', ASCENDING), ('position', ASCENDING)]),
+            # A driver's records across tracks, via find({'driverSlug': ...})
+            IndexModel([('driverSlug', ASCENDING), ('trackSlug', ASCENDING)]),
+            # Unique constraint includes kartType (allows same driver on different kart types)
+            IndexModel(
+                [('trackSlug', ASCENDING), ('driverSlug', ASCENDING), ('kartType', ASCENDING)],
+                unique=True
+            ),
+            IndexModel([('tier', ASCENDING), ('trackId', ASCENDING)]),
+            IndexModel([('trackSlug', ASCENDING), ('kartType', ASCENDING)]),  # Index for kart type filtering
+            IndexModel([('kartType', ASCENDING)])
+        ],
+        warzones_col: [
+            IndexModel([('trackSlug', ASCENDING), ('kartType', ASCENDING)], unique=True),
+            IndexModel([('trackId', ASCENDING)])
+        ],
+        worldrecordhistory_col: [
+            IndexModel([('trackSlug', ASCENDING), ('kartType', ASCENDING), ('dateBroken', ASCENDING)]),
+            IndexModel([('trackSlug', ASCENDING), ('kartType', ASCENDING), ('isCurrent', ASCENDING)]),
+            IndexModel([('trackId', ASCENDING)])
+        ]
+    }
 
-    # World Record History indexes
-    worldrecordhistory_col.create_index([('trackSlug', ASCENDING), ('kartType', ASCENDING), ('dateBroken', ASCENDING)])
-    worldrecordhistory_col.create_index([('trackSlug', ASCENDING), ('kartType', ASCENDING), ('isCurrent', ASCENDING)])
-    worldrecordhistory_col.create_index([('trackId', ASCENDING)])
+    # Build the collections' indexes concurrently
+    with ThreadPoolExecutor(max_workers=len(index_models)) as executor:
+        futures = [executor.submit(col.create_indexes, models) for col, models in index_models.items()]
+        for future in futures:
+            future.result()
 
     print("[OK] Indexes created successfully!")
 
 
+class ThreadOutput:
+    """
+    sys.stdout stand-in that collects each thread's output separately while it
+    is capturing, so tracks synced concurrently can print their logs whole.
+    Threads that are not capturing write straight through.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.local = threading.local()
+
+    def start_capture(self):
+        self.local.buffer = io.StringIO()
+
+    def stop_capture(self):
+        buffer, self.local.buffer = self.local.buffer, None
+        return buffer.getvalue()
+
+    def write(self, text):
+        buffer = getattr(self.local, 'buffer', None)
+        if buffer is None:
+            return self.stream.write(text)
+        return buffer.write(text)
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+
+def sync_track_captured(output, track_info):
+    """
+    Run sync_track() with this thread's output captured.
+
+    Returns:
+        Tuple of (result, log, error); error is the exception raised, if any
+    """
+    output.start_capture()
+    try:
+        result = sync_track(track_info)
+    except Exception as e:
+        return None, output.stop_capture(), e
+    return result, output.stop_capture(), None
+
+
 def main():
     """Main execution function."""
     print("\n" + "="*60)
@@ -763,16 +1024,24 @@ def main():
     # Create indexes
     create_indexes()
 
-    # Sync each track
+    # Sync the tracks concurrently; their Atlas round trips overlap and each
+    # track's log is printed as one block, in TRACKS_DATA order
     results = []
-    for track_info in TRACKS_DATA:
-        try:
-            result = sync_track(track_info)
-            results.append(result)
-        except Exception as e:
-            print(f"\nError processing {track_info['name']}: {e}")
-            import traceback
-            traceback.print_exc()
+    output = ThreadOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=len(TRACKS_DATA)) as executor:
+            futures = [executor.submit(sync_track_captured, output, track_info) for track_info in TRACKS_DATA]
+            for track_info, future in zip(TRACKS_DATA, futures):
+                result, log, error = future.result()
+                print(log, end='')
+                if error is None:
+                    results.append(result)
+                else:
+                    print(f"\nError processing {track_info['name']}: {error}")
+                    traceback.print_exception(type(error), error, error.__traceback__)
+    finally:
+        sys.stdout = output.stream
 
     # Print summary
     print("\n" + "="*60)